@@ -28,6 +28,7 @@ func main() {
 	dataDir := flag.String("dir", "./data", "Data directory (for Disk / Hybrid modes)")
 	port := flag.Int("port", 8080, "REST API port")
 	grpcPort := flag.Int("grpc-port", 50051, "gRPC port")
+	grpcMaxMsgMB := flag.Int("grpc-max-msg-mb", 4, "Max gRPC message size in MB (send and receive)")
 	authOn := flag.Bool("auth", false, "Enable JWT authentication on all routes")
 	cfgFile := flag.String("config", "", "Path to JSON config file (overrides flags)")
 	flag.Parse()
@@ -50,6 +51,7 @@ func main() {
 		cfg.DataDir = *dataDir
 		cfg.Port = *port
 		cfg.GrpcPort = *grpcPort
+		cfg.GrpcMaxMsgMB = *grpcMaxMsgMB
 	}
 
 	// ── Open engine ──────────────────────────────────────────────────────────
@@ -86,7 +88,10 @@ func main() {
 		if err != nil {
 			log.Fatalf("gRPC listen error: %v", err)
 		}
-		gs := grpc.NewServer()
+		gs := grpc.NewServer(
+			grpc.MaxRecvMsgSize(cfg.GrpcMaxMsgMB<<20),
+			grpc.MaxSendMsgSize(cfg.GrpcMaxMsgMB<<20),
+		)
 		kvi_grpc.RegisterKviServiceServer(gs, kvi_grpc.NewGrpcServer(eng, hub))
 		log.Printf("gRPC API  → grpc://0.0.0.0%s", addr)
 		if err := gs.Serve(lis); err != nil {
@@ -122,7 +122,7 @@ func (xe *Executor) handleInsert(ctx context.Context, stmt *sqlparser.Insert) (i
 		return nil, errors.New("INSERT must include a VALUES clause")
 	}
 
-	var results []map[string]string
+	results := make([]map[string]string, 0, len(rows))
 	for _, tuple := range rows {
 		if len(stmt.Columns) != len(tuple) {
 			return nil, fmt.Errorf("column count (%d) does not match values count (%d)",
@@ -130,7 +130,7 @@ func (xe *Executor) handleInsert(ctx context.Context, stmt *sqlparser.Insert) (i
 		}
 
 		var id string
-		data := make(map[string]interface{})
+		data := make(map[string]interface{}, len(stmt.Columns))
 
 		for i, col := range stmt.Columns {
 			colName := strings.ToLower(col.String())
@@ -210,6 +210,14 @@ func (s *Server) handleSub(w http.ResponseWriter, r *http.Request) {
 				return
 			}
 			fmt.Fprintf(w, "data: %s\n\n", msg.Payload)
+			// Write out everything already queued before flushing, so a burst
+			// of messages goes out in one write instead of one per message.
+			// Buffered messages are still delivered after a close, so these
+			// receives never see a closed channel; the select above does.
+			for pending := len(sub.C); pending > 0; pending-- {
+				msg = <-sub.C
+				fmt.Fprintf(w, "data: %s\n\n", msg.Payload)
+			}
 			flusher.Flush()
 		}
 	}
@@ -12,6 +12,7 @@ type Config struct {
 	EnablePubSub  bool       `json:"enable_pubsub"`
 	Port          int        `json:"port"`
 	GrpcPort      int        `json:"grpc_port"`
+	GrpcMaxMsgMB  int        `json:"grpc_max_msg_mb"`
 	VectorDim     int        `json:"vector_dim"`
 }
 
@@ -26,6 +27,7 @@ func DefaultConfig() *Config {
 		EnablePubSub:  true,
 		Port:          8080,
 		GrpcPort:      50051,
+		GrpcMaxMsgMB:  4,
 		VectorDim:     384,
 	}
 }
@@ -1,43 +1,174 @@
-import requests
-from typing import Dict, Any, Optional, List
+import atexit
+import json
+import os
+import threading
+from typing import TYPE_CHECKING, Dict, Any, Optional, List
+
+if TYPE_CHECKING:
+    import requests
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+def _json_dumps(obj: Any) -> bytes:
+    # allow_nan=False rejects NaN/Infinity, which the server cannot decode.
+    return json.dumps(obj, separators=(",", ":"), allow_nan=False).encode()
+
+if orjson is not None:
+    # datetime and dataclass values go to the stdlib encoder, which rejects
+    # them as requests' json= did. orjson still encodes uuid.UUID and
+    # enum.Enum values itself; it has no passthrough option for them.
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+    def _dumps(obj: Any) -> bytes:
+        try:
+            body = orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # Ints beyond 64 bits, lone surrogates and passed-through types;
+            # the stdlib encoder handles what it can and raises on the rest.
+            return _json_dumps(obj)
+        # orjson writes NaN/Infinity as null instead of failing. Re-encode any
+        # body with a null through the stdlib encoder so they are rejected.
+        if b"null" in body:
+            return _json_dumps(obj)
+        return body
+
+    _loads = orjson.loads
+else:
+    _dumps = _json_dumps
+    _loads = json.loads
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+def _encode_body(payload: Any) -> bytes:
+    """Encode a request body, raising InvalidJSONError like requests' json= did"""
+    try:
+        return _dumps(payload)
+    except ValueError as e:
+        from requests.exceptions import InvalidJSONError
+
+        raise InvalidJSONError(e) from e
+
+def _decode_body(content: bytes) -> Any:
+    """Decode a response body, raising requests' JSONDecodeError on bad JSON"""
+    try:
+        return _loads(content)
+    except ValueError as e:
+        from requests.exceptions import JSONDecodeError
+
+        raise JSONDecodeError(getattr(e, "msg", str(e)), getattr(e, "doc", ""), getattr(e, "pos", 0)) from e
+
+# Max keep-alive connections per host, sized for clients used from many threads.
+_POOL_MAXSIZE = 32
+
+def _new_session() -> "requests.Session":
+    """Create an HTTP session with a keep-alive connection pool"""
+    # requests (and urllib3 under it) is imported on first use so that
+    # importing this module stays cheap.
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=_POOL_MAXSIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+# Sessions shared per host by clients created with share_session=True, so
+# short-lived clients don't pay a new TCP/TLS handshake each time.
+_sessions: Dict[str, "requests.Session"] = {}
+_sessions_lock = threading.Lock()
+
+def _session_for(host: str) -> "requests.Session":
+    """Return the shared HTTP session for a server host"""
+    session = _sessions.get(host)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.get(host)
+            if session is None:
+                session = _new_session()
+                _sessions[host] = session
+    return session
+
+@atexit.register
+def _close_sessions() -> None:
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+def _forget_sessions_after_fork() -> None:
+    # A forked child must not reuse the parent's pooled sockets. Drop the
+    # sessions without closing them, since the parent still owns those
+    # connections.
+    global _sessions_lock
+    _sessions_lock = threading.Lock()
+    _sessions.clear()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_sessions_after_fork)
 
 class KviClient:
-    def __init__(self, host: str = "http://localhost:8080"):
+    """HTTP client for the Kvi REST API.
+
+    By default each client owns its requests.Session. With share_session=True
+    all such clients for the same host use one session, including its cookie
+    jar, default headers and mounted adapters, and close() leaves it open.
+    """
+
+    def __init__(self, host: str = "http://localhost:8080", share_session: bool = False):
         self.host = host.rstrip("/")
         self.base_url = f"{self.host}/api/v1"
+        self._shared = share_session
+        self._session = _session_for(self.host) if share_session else _new_session()
+
+    def close(self) -> None:
+        """Close the client's own session; a shared session stays open until exit"""
+        if not self._shared:
+            self._session.close()
+
+    def __enter__(self) -> "KviClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
 
     def put(self, key: str, data: Dict[str, Any]) -> bool:
         """Store a record by key"""
         url = f"{self.base_url}/put"
         payload = {"key": key, "data": data}
-        response = requests.post(url, json=payload)
+        response = self._session.post(url, data=_encode_body(payload), headers=_JSON_HEADERS)
         response.raise_for_status()
         return response.status_code == 201
 
     def get(self, key: str) -> Optional[Dict[str, Any]]:
         """Retrieve a record by key"""
         url = f"{self.base_url}/get"
-        response = requests.get(url, params={"key": key})
+        response = self._session.get(url, params={"key": key})
         if response.status_code == 404:
             return None
         response.raise_for_status()
-        return response.json()
+        return _decode_body(response.content)
 
     def query(self, sql_query: str) -> Any:
         """Execute a standard SQL query string"""
         url = f"{self.base_url}/query"
         payload = {"query": sql_query}
-        response = requests.post(url, json=payload)
+        response = self._session.post(url, data=_encode_body(payload), headers=_JSON_HEADERS)
         response.raise_for_status()
-        return response.json()
+        return _decode_body(response.content)
 
     def publish(self, channel: str, message: str) -> int:
         """Publish a message to a pub/sub channel"""
         url = f"{self.base_url}/pub"
         payload = {"channel": channel, "message": message}
-        response = requests.post(url, json=payload)
+        response = self._session.post(url, data=_encode_body(payload), headers=_JSON_HEADERS)
         response.raise_for_status()
-        data = response.json()
+        data = _decode_body(response.content)
         return data.get("receivers", 0)
 
 # Example Usage:
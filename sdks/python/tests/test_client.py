@@ -0,0 +1,105 @@
+import datetime
+import json
+import math
+import os
+import subprocess
+import sys
+
+import pytest
+
+SDK_DIR = os.path.join(os.path.dirname(__file__), "..")
+sys.path.insert(0, SDK_DIR)
+
+from kvi import client
+
+PAYLOADS = [
+    {"key": "k", "data": {1: "a", 2.5: "b", None: "c"}},
+    {"key": "k", "data": {"big": 2**70, "neg": -(2**70), "small": 42}},
+    {"key": "k", "data": {"name": "Zo\u00eb", "tags": ["x", None, 1.5]}},
+    {"key": "k", "data": {"s": "\udcff"}},
+]
+
+REJECTED = [
+    ({"x": math.nan}, ValueError),
+    ({"x": math.inf}, ValueError),
+    ({"x": [-math.inf]}, ValueError),
+    ({"x": datetime.datetime(2026, 1, 1)}, TypeError),
+]
+
+def requests_json_body(payload):
+    """The body requests sends for json=payload"""
+    requests = pytest.importorskip("requests")
+    return requests.Request("POST", "http://kvi", json=payload).prepare().body
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_encoder_matches_requests_json(payload):
+    assert json.loads(client._dumps(payload)) == json.loads(requests_json_body(payload))
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_orjson_encoder_matches_stdlib(payload):
+    pytest.importorskip("orjson")
+    assert json.loads(client._dumps(payload)) == json.loads(client._json_dumps(payload))
+
+@pytest.mark.parametrize("payload,exc", REJECTED)
+def test_encoders_reject_what_requests_rejects(payload, exc):
+    with pytest.raises(exc):
+        client._json_dumps(payload)
+    with pytest.raises(exc):
+        client._dumps(payload)
+
+def test_lone_surrogate_is_escaped():
+    assert client._dumps({"s": "\udcff"}) == b'{"s":"\\udcff"}'
+
+def test_encode_errors_are_requests_exceptions():
+    requests = pytest.importorskip("requests")
+    with pytest.raises(requests.exceptions.InvalidJSONError):
+        client._encode_body({"x": math.nan})
+
+def test_decode_errors_are_requests_exceptions():
+    requests = pytest.importorskip("requests")
+    with pytest.raises(requests.exceptions.JSONDecodeError):
+        client._decode_body(b"{not json")
+    with pytest.raises(requests.exceptions.RequestException):
+        client._decode_body(b"\xff")
+
+def test_import_does_not_load_requests():
+    code = "import sys, kvi.client; print('requests' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], cwd=SDK_DIR, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
+
+def test_clients_own_their_session_by_default(monkeypatch):
+    pytest.importorskip("requests")
+    a = client.KviClient("http://kvi-a:8080")
+    b = client.KviClient("http://kvi-a:8080")
+    assert a._session is not b._session
+    closed = []
+    monkeypatch.setattr(a._session, "close", lambda: closed.append(True))
+    a.close()
+    assert closed == [True]
+
+def test_shared_session_is_reused_per_host(monkeypatch):
+    pytest.importorskip("requests")
+    a = client.KviClient("http://kvi-a:8080", share_session=True)
+    b = client.KviClient("http://kvi-a:8080/", share_session=True)
+    c = client.KviClient("http://kvi-b:8080", share_session=True)
+    assert a._session is b._session
+    assert a._session is not c._session
+    closed = []
+    monkeypatch.setattr(a._session, "close", lambda: closed.append(True))
+    a.close()
+    assert closed == []
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork()")
+def test_forked_child_does_not_inherit_shared_sessions():
+    pytest.importorskip("requests")
+    client.KviClient("http://kvi-a:8080", share_session=True)
+    assert client._sessions
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.write(write_fd, str(len(client._sessions)).encode())
+        os._exit(0)
+    os.close(write_fd)
+    os.waitpid(pid, 0)
+    assert os.read(read_fd, 16) == b"0"
+    os.close(read_fd)
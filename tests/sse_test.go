@@ -0,0 +1,133 @@
+package tests
+
+import (
+	"bytes"
+	"context"
+	"encoding/json"
+	"fmt"
+	"net/http"
+	"net/http/httptest"
+	"strings"
+	"sync"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+	"github.com/thirawat27/kvi/pkg/api"
+	"github.com/thirawat27/kvi/pkg/config"
+	"github.com/thirawat27/kvi/pkg/kvi"
+)
+
+// flushRecorder hands each flushed chunk to the test and then blocks until
+// the test releases it, so messages can be queued while the handler waits.
+type flushRecorder struct {
+	mu      sync.Mutex
+	header  http.Header
+	buf     bytes.Buffer
+	flushes chan string
+	release chan struct{}
+}
+
+func newFlushRecorder() *flushRecorder {
+	return &flushRecorder{
+		header:  make(http.Header),
+		flushes: make(chan string),
+		release: make(chan struct{}),
+	}
+}
+
+func (f *flushRecorder) Header() http.Header { return f.header }
+
+func (f *flushRecorder) WriteHeader(int) {}
+
+func (f *flushRecorder) Write(p []byte) (int, error) {
+	f.mu.Lock()
+	defer f.mu.Unlock()
+	return f.buf.Write(p)
+}
+
+func (f *flushRecorder) Flush() {
+	f.mu.Lock()
+	chunk := f.buf.String()
+	f.buf.Reset()
+	f.mu.Unlock()
+	f.flushes <- chunk
+	<-f.release
+}
+
+func publish(t *testing.T, mux *http.ServeMux, channel, message string) int {
+	body := fmt.Sprintf(`{"channel":%q,"message":%q}`, channel, message)
+	rec := httptest.NewRecorder()
+	mux.ServeHTTP(rec, httptest.NewRequest(http.MethodPost, "/api/v1/pub", strings.NewReader(body)))
+	require.Equal(t, http.StatusOK, rec.Code)
+
+	var resp struct {
+		Receivers int `json:"receivers"`
+	}
+	require.NoError(t, json.Unmarshal(rec.Body.Bytes(), &resp))
+	return resp.Receivers
+}
+
+func nextFlush(t *testing.T, f *flushRecorder) string {
+	select {
+	case chunk := <-f.flushes:
+		return chunk
+	case <-time.After(2 * time.Second):
+		t.Fatal("timed out waiting for SSE flush")
+		return ""
+	}
+}
+
+func TestSubscribeSSECoalescesBurst(t *testing.T) {
+	eng, err := kvi.Open(config.MemoryConfig())
+	assert.NoError(t, err)
+	defer eng.Close()
+
+	mux := http.NewServeMux()
+	api.NewServer(eng).RegisterHandlers(mux)
+
+	ctx, cancel := context.WithCancel(context.Background())
+	req := httptest.NewRequest(http.MethodGet, "/api/v1/sub?channel=news&id=sub1", nil).WithContext(ctx)
+	w := newFlushRecorder()
+	done := make(chan struct{})
+	go func() {
+		mux.ServeHTTP(w, req)
+		close(done)
+	}()
+
+	// Wait for the subscription to be registered.
+	deadline := time.Now().Add(2 * time.Second)
+	for publish(t, mux, "news", "first") == 0 {
+		require.True(t, time.Now().Before(deadline), "subscriber never registered")
+		time.Sleep(5 * time.Millisecond)
+	}
+
+	// A single message on an idle stream is flushed right away.
+	assert.Equal(t, "data: first\n\n", nextFlush(t, w))
+
+	// Queue a burst while the handler is blocked in Flush.
+	var want strings.Builder
+	for i := 0; i < 10; i++ {
+		msg := fmt.Sprintf("burst-%d", i)
+		assert.Equal(t, 1, publish(t, mux, "news", msg))
+		fmt.Fprintf(&want, "data: %s\n\n", msg)
+	}
+	w.release <- struct{}{}
+
+	// The whole burst goes out in one flush, one event per message, in order.
+	assert.Equal(t, want.String(), nextFlush(t, w))
+	w.release <- struct{}{}
+
+	// Back to idle: the next message is again flushed on its own.
+	assert.Equal(t, 1, publish(t, mux, "news", "last"))
+	assert.Equal(t, "data: last\n\n", nextFlush(t, w))
+	w.release <- struct{}{}
+
+	cancel()
+	select {
+	case <-done:
+	case <-time.After(2 * time.Second):
+		t.Fatal("SSE handler did not return after cancel")
+	}
+}